@@ -5,18 +5,22 @@ A FastAPI-based REST API for the Go web crawler.
 Provides endpoints for crawling websites, scraping pages, and extracting links.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, HttpUrl, validator
-from typing import Optional, List, Dict, Any
-import subprocess
-import tempfile
-import json
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from typing import Annotated, Optional, List, Dict, Any, Tuple, AsyncIterator
+from contextlib import aclosing, asynccontextmanager
+from functools import partial
+import asyncio
+import hashlib
 import os
 import logging
+import time
 from pathlib import Path
-from datetime import datetime
+
+import orjson
+from cachetools import TTLCache
 
 # Configure logging
 logging.basicConfig(
@@ -31,7 +35,8 @@ app = FastAPI(
     description="A powerful web crawling API that extracts content, links, and metadata from websites",
     version="1.0.0",
     docs_url="/",  # Swagger UI at root
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for browser access
@@ -53,34 +58,78 @@ if not CRAWLER_BINARY.exists():
         "It should be copied during Docker build."
     )
 
+# Cache of recent single-page results so repeat /scrape and /links calls
+# for the same URL skip the crawl entirely. Entries hold the result and the
+# time.monotonic() time it expires.
+RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", "300"))
+_result_cache: TTLCache = TTLCache(maxsize=1024, ttl=RESULT_CACHE_TTL)
+
+# Crawls currently running, keyed like the result cache, so identical
+# concurrent requests share one crawl
+_inflight: Dict[bytes, asyncio.Task] = {}
+
+# Optional page fields the crawler leaves out when empty
+_PAGE_DEFAULTS = {"content": None, "links": None}
+
+# Number of long-lived crawler processes serving requests
+CRAWLER_POOL_SIZE = int(os.getenv("CRAWLER_POOL_SIZE", "4"))
+
+# Largest single reply accepted from a crawler worker
+WORKER_READ_LIMIT = 256 * 1024 * 1024
+
+# Crawl request fields that map onto crawler flags, as (field, flag, formatter).
+# Fields without a formatter are boolean switches emitted only when set.
+_CRAWL_ARG_SPEC = (
+    ("extract_links", "-extract-links", None),
+    ("depth", "-depth", str),
+    ("max_pages", "-max", str),
+    ("workers", "-workers", str),
+    ("filter", "-filter", str),
+    ("seed_only", "-seed-only", None),
+    ("news", "-news", None),
+    ("delay", "-delay", str),
+    ("timeout", "-timeout", str),
+    ("verbose", "-verbose", None),
+)
+
 
 # ============================================================================
 # Pydantic Models (Request/Response schemas)
 # ============================================================================
 
+# URL prefixes accepted by the request models
+_URL_SCHEMES = ('http://', 'https://')
+
+# Longest URL and filter accepted by the request models, which keeps every
+# request well under the crawler's 1 MiB request line limit
+MAX_URL_LENGTH = 2048
+MAX_FILTER_LENGTH = 1024
+
+
 class CrawlRequest(BaseModel):
     """Request model for full website crawling"""
-    url: str = Field(..., description="The URL to start crawling from")
+    url: str = Field(..., max_length=MAX_URL_LENGTH, description="The URL to start crawling from")
     extract_links: bool = Field(False, description="Extract links from pages")
     depth: int = Field(1, ge=0, le=5, description="Maximum crawl depth (0-5)")
     max_pages: int = Field(20, ge=1, le=100, description="Maximum pages to crawl (1-100)")
     workers: int = Field(2, ge=1, le=10, description="Number of concurrent workers (1-10)")
     stay_domain: bool = Field(True, description="Stay on the same domain")
-    filter: Optional[str] = Field(None, description="Only crawl URLs containing this string")
+    filter: Optional[str] = Field(None, max_length=MAX_FILTER_LENGTH, description="Only crawl URLs containing this string")
     seed_only: bool = Field(False, description="Crawl only the seed URL")
     news: bool = Field(False, description="Extract news article content")
     delay: int = Field(1, ge=0, le=10, description="Delay between requests in seconds (0-10)")
     timeout: int = Field(10, ge=5, le=60, description="Request timeout in seconds (5-60)")
     verbose: bool = Field(False, description="Enable verbose output")
 
-    @validator('url')
-    def validate_url(cls, v):
-        if not (v.startswith('http://') or v.startswith('https://')):
+    @field_validator('url')
+    @classmethod
+    def validate_url(cls, v: str) -> str:
+        if not v.startswith(_URL_SCHEMES):
             raise ValueError('URL must start with http:// or https://')
         return v
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com",
                 "extract_links": True,
@@ -89,44 +138,72 @@ class CrawlRequest(BaseModel):
                 "workers": 2
             }
         }
+    )
 
 
 class ScrapeRequest(BaseModel):
     """Request model for quick single-page scraping"""
-    url: str = Field(..., description="The URL to scrape")
+    url: str = Field(..., max_length=MAX_URL_LENGTH, description="The URL to scrape")
     extract_links: bool = Field(False, description="Also extract links from the page")
 
-    @validator('url')
-    def validate_url(cls, v):
-        if not (v.startswith('http://') or v.startswith('https://')):
+    @field_validator('url')
+    @classmethod
+    def validate_url(cls, v: str) -> str:
+        if not v.startswith(_URL_SCHEMES):
             raise ValueError('URL must start with http:// or https://')
         return v
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com",
                 "extract_links": False
             }
         }
+    )
 
 
 class LinksRequest(BaseModel):
     """Request model for extracting links only"""
-    url: str = Field(..., description="The URL to extract links from")
+    url: str = Field(..., max_length=MAX_URL_LENGTH, description="The URL to extract links from")
 
-    @validator('url')
-    def validate_url(cls, v):
-        if not (v.startswith('http://') or v.startswith('https://')):
+    @field_validator('url')
+    @classmethod
+    def validate_url(cls, v: str) -> str:
+        if not v.startswith(_URL_SCHEMES):
             raise ValueError('URL must start with http:// or https://')
         return v
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com"
             }
         }
+    )
+
+
+class BatchScrapeRequest(BaseModel):
+    """Request model for scraping several pages at once"""
+    urls: List[Annotated[str, Field(max_length=MAX_URL_LENGTH)]] = Field(..., min_length=1, max_length=100, description="The URLs to scrape (1-100)")
+    extract_links: bool = Field(False, description="Also extract links from each page")
+
+    @field_validator('urls')
+    @classmethod
+    def validate_urls(cls, v: List[str]) -> List[str]:
+        for url in v:
+            if not url.startswith(_URL_SCHEMES):
+                raise ValueError(f'URL must start with http:// or https://: {url}')
+        return v
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "urls": ["https://example.com", "https://example.org"],
+                "extract_links": False
+            }
+        }
+    )
 
 
 class PageData(BaseModel):
@@ -172,13 +249,215 @@ class HealthResponse(BaseModel):
     crawler_available: bool
 
 
+# ============================================================================
+# Crawler Worker Pool
+# ============================================================================
+
+class CrawlerError(Exception):
+    """Raised when a crawler worker reports a failed crawl"""
+
+
+class CrawlerWorker:
+    """
+    A long-lived crawler process running in server mode.
+    
+    Requests are written to the process as one JSON object per line on
+    stdin and replies are read back one per line from stdout, so the Go
+    runtime and its HTTP connection pool are reused across crawls.
+    """
+
+    def __init__(self):
+        self.process: Optional[asyncio.subprocess.Process] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        """Spawn the crawler process."""
+        self.process = await asyncio.create_subprocess_exec(
+            str(CRAWLER_BINARY), "-server",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=WORKER_READ_LIMIT
+        )
+
+    async def stop(self):
+        """Terminate the crawler process, killing it if it does not exit."""
+        if not self.alive:
+            return
+        self.process.terminate()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+
+    async def run(self, args: List[str], timeout: int) -> List[Dict[str, Any]]:
+        """
+        Run a single crawl on this worker.
+        
+        Args:
+            args: Command-line arguments describing the crawl
+            timeout: Maximum execution time in seconds
+            
+        Returns:
+            The crawled pages
+            
+        Raises:
+            asyncio.TimeoutError: If the crawl does not finish in time
+            CrawlerError: If the crawler reports an error
+        """
+        # A plain crawl has no replies ahead of the final response
+        async with aclosing(self._exchange({"args": args}, timeout)) as replies:
+            async for reply in replies:
+                pages = reply["pages"]
+        
+        return pages or []
+
+    async def stream(self, args: List[str], timeout: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run a single crawl on this worker, yielding pages as they are crawled.
+        
+        Args:
+            args: Command-line arguments describing the crawl
+            timeout: Maximum execution time in seconds for the whole crawl
+            
+        Raises:
+            asyncio.TimeoutError: If the crawl does not finish in time
+            CrawlerError: If the crawler reports an error
+        """
+        async with aclosing(self._exchange({"args": args, "stream": True}, timeout)) as replies:
+            async for reply in replies:
+                if "page" in reply:
+                    yield reply["page"]
+
+    async def batch(self, batch: List[List[str]], timeout: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run several crawls concurrently on this worker.
+        
+        Yields one `{"index", "pages", "error"}` result per crawl, in the
+        order the crawls finish.
+        
+        Args:
+            batch: Command-line arguments for each crawl
+            timeout: Maximum execution time in seconds for the whole batch
+            
+        Raises:
+            asyncio.TimeoutError: If the batch does not finish in time
+        """
+        async with aclosing(self._exchange({"batch": batch}, timeout)) as replies:
+            async for reply in replies:
+                if "index" in reply:
+                    yield reply
+
+    async def _exchange(self, request: Dict[str, Any], timeout: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Send a request and yield each reply line, ending with the final
+        response.
+        
+        Raises:
+            asyncio.TimeoutError: If the final response does not arrive in time
+            CrawlerError: If the crawler reports an error
+        """
+        if not self.alive:
+            await self.start()
+        
+        self.process.stdin.write(orjson.dumps(request) + b"\n")
+        await self.process.stdin.drain()
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        finished = False
+        try:
+            while True:
+                line = await asyncio.wait_for(
+                    self.process.stdout.readline(),
+                    timeout=max(deadline - loop.time(), 0)
+                )
+                if not line:
+                    raise CrawlerError("Crawler worker exited unexpectedly")
+                
+                reply = orjson.loads(line)
+                # Streamed pages and batch results precede the final
+                # response, the only reply with pages and no index
+                if "pages" not in reply or "index" in reply:
+                    yield reply
+                    continue
+                
+                finished = True
+                if reply.get("error"):
+                    raise CrawlerError(reply["error"])
+                yield reply
+                return
+        finally:
+            # A request abandoned part-way leaves unread output behind, so
+            # discard the process rather than let it reach the next request
+            if not finished:
+                await self.stop()
+
+
+class CrawlerPool:
+    """A fixed-size pool of crawler workers handed out through a queue"""
+
+    def __init__(self, size: int):
+        self.workers = [CrawlerWorker() for _ in range(size)]
+        self._idle: asyncio.Queue = asyncio.Queue()
+
+    async def start(self):
+        """Spawn every worker in the pool."""
+        for worker in self.workers:
+            await worker.start()
+            self._idle.put_nowait(worker)
+
+    async def stop(self):
+        """Shut down every worker in the pool."""
+        await asyncio.gather(*(worker.stop() for worker in self.workers))
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[CrawlerWorker]:
+        """Take the next idle worker for exclusive use."""
+        worker = await self._idle.get()
+        try:
+            yield worker
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def run(self, args: List[str], timeout: int) -> List[Dict[str, Any]]:
+        """Run a crawl on the next idle worker."""
+        async with self.acquire() as worker:
+            return await worker.run(args, timeout)
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+def _get_pool() -> CrawlerPool:
+    """Return the crawler worker pool, or fail if it was never started."""
+    pool: Optional[CrawlerPool] = getattr(app.state, "crawler_pool", None)
+    if pool is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Crawler is not available"
+        )
+    return pool
+
+
+def _finish_inflight(key: bytes, task: asyncio.Task):
+    """Forget a finished shared crawl and mark its exception as retrieved."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
 async def run_crawler(args: List[str], timeout: int = 60) -> Dict[str, Any]:
     """
-    Run the Go crawler binary with the specified arguments.
+    Run a crawl with the specified arguments on the worker pool.
+    
+    Concurrent calls with identical arguments share a single crawl: only
+    the first one runs, and the others wait for its result.
     
     Args:
         args: Command-line arguments to pass to the crawler
@@ -190,38 +469,42 @@ async def run_crawler(args: List[str], timeout: int = 60) -> Dict[str, Any]:
     Raises:
         HTTPException: If the crawler fails or times out
     """
-    # Create a temporary file for the output
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-        output_file = tmp.name
+    key = _cache_key(args)
+    
+    task = _inflight.get(key)
+    if task is None:
+        # Run the crawl as its own task so that cancelling any caller, the
+        # first one included, can't cancel it for the others
+        task = asyncio.create_task(_run_crawler(args, timeout))
+        task.add_done_callback(partial(_finish_inflight, key))
+        _inflight[key] = task
+    return await asyncio.shield(task)
+
+
+async def _run_crawler(args: List[str], timeout: int) -> Dict[str, Any]:
+    """Run a crawl on the worker pool and time it."""
+    pool = _get_pool()
     
     try:
-        # Build the command
-        cmd = [str(CRAWLER_BINARY), "-output", output_file] + args
-        
-        logger.info(f"Running crawler: {' '.join(cmd)}")
+        logger.info(f"Running crawler: {' '.join(args)}")
         
-        # Run the crawler
-        start_time = datetime.now()
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
-        execution_time = (datetime.now() - start_time).total_seconds()
-        
-        # Check if the process succeeded
-        if result.returncode != 0:
-            error_msg = result.stderr if result.stderr else "Unknown error"
-            logger.error(f"Crawler failed: {error_msg}")
+        # Run the crawl on a pooled worker process
+        start_time = time.perf_counter()
+        try:
+            data = await pool.run(args, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Crawler timed out after {timeout} seconds")
+            raise HTTPException(
+                status_code=504,
+                detail=f"Crawler timed out after {timeout} seconds"
+            )
+        except CrawlerError as e:
+            logger.error(f"Crawler failed: {e}")
             raise HTTPException(
                 status_code=500,
-                detail=f"Crawler failed: {error_msg}"
+                detail=f"Crawler failed: {e}"
             )
-        
-        # Read and parse the output
-        with open(output_file, 'r') as f:
-            data = json.load(f)
+        execution_time = time.perf_counter() - start_time
         
         logger.info(f"Crawler completed in {execution_time:.2f}s")
         
@@ -230,13 +513,9 @@ async def run_crawler(args: List[str], timeout: int = 60) -> Dict[str, Any]:
             "execution_time": execution_time
         }
         
-    except subprocess.TimeoutExpired:
-        logger.error(f"Crawler timed out after {timeout} seconds")
-        raise HTTPException(
-            status_code=504,
-            detail=f"Crawler timed out after {timeout} seconds"
-        )
-    except json.JSONDecodeError as e:
+    except HTTPException:
+        raise
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse crawler output: {e}")
         raise HTTPException(
             status_code=500,
@@ -248,12 +527,105 @@ async def run_crawler(args: List[str], timeout: int = 60) -> Dict[str, Any]:
             status_code=500,
             detail=f"Unexpected error: {str(e)}"
         )
-    finally:
-        # Clean up the temporary file
-        try:
-            os.unlink(output_file)
-        except Exception:
-            pass
+
+
+async def stream_crawler(pool: CrawlerPool, args: List[str], timeout: int = 60) -> AsyncIterator[bytes]:
+    """
+    Run a crawl on the worker pool, yielding each page as an NDJSON line.
+    
+    Errors after the response has started are reported as a final
+    `{"error": ...}` line, since the status code has already been sent.
+    """
+    logger.info(f"Streaming crawler: {' '.join(args)}")
+    
+    try:
+        async with pool.acquire() as worker, aclosing(worker.stream(args, timeout)) as pages:
+            async for page in pages:
+                yield orjson.dumps({**_PAGE_DEFAULTS, **page}) + b"\n"
+    except asyncio.TimeoutError:
+        logger.error(f"Crawler timed out after {timeout} seconds")
+        yield orjson.dumps({"error": f"Crawler timed out after {timeout} seconds"}) + b"\n"
+    except CrawlerError as e:
+        logger.error(f"Crawler failed: {e}")
+        yield orjson.dumps({"error": f"Crawler failed: {e}"}) + b"\n"
+
+
+async def stream_batch_scrape(
+    pool: CrawlerPool,
+    urls: List[str],
+    batch: List[List[str]],
+    timeout: int = 60
+) -> AsyncIterator[bytes]:
+    """
+    Scrape a batch of pages on a single worker, yielding each result as an
+    NDJSON line in the order the scrapes finish.
+    
+    Each line is the scraped page, or `{"url": ..., "error": ...}` if that
+    page could not be scraped.
+    """
+    logger.info(f"Running batch scrape of {len(urls)} URLs")
+    
+    try:
+        async with pool.acquire() as worker, aclosing(worker.batch(batch, timeout)) as results:
+            async for result in results:
+                url = urls[result["index"]]
+                if result.get("error"):
+                    line = {"url": url, "error": f"Crawler failed: {result['error']}"}
+                elif not result["pages"]:
+                    line = {"url": url, "error": "No data returned from the page"}
+                else:
+                    line = {**_PAGE_DEFAULTS, **result["pages"][0]}
+                yield orjson.dumps(line) + b"\n"
+    except asyncio.TimeoutError:
+        logger.error(f"Batch scrape timed out after {timeout} seconds")
+        yield orjson.dumps({"error": f"Crawler timed out after {timeout} seconds"}) + b"\n"
+    except CrawlerError as e:
+        logger.error(f"Crawler failed: {e}")
+        yield orjson.dumps({"error": f"Crawler failed: {e}"}) + b"\n"
+
+
+def _cache_key(args: List[str]) -> bytes:
+    """Build a compact cache key from crawler arguments."""
+    return hashlib.blake2b(orjson.dumps(args), digest_size=16).digest()
+
+
+def _bypass_cache(http_request: Request) -> bool:
+    """Check whether the client asked to skip cached results."""
+    return "no-cache" in http_request.headers.get("cache-control", "")
+
+
+async def cached_run(
+    key: bytes,
+    args: List[str],
+    timeout: int = 60,
+    use_cache: bool = True
+) -> Tuple[Dict[str, Any], Optional[int]]:
+    """
+    Run the crawler, serving repeat requests from the result cache.
+    
+    Args:
+        key: Cache key for the request
+        args: Command-line arguments to pass to the crawler
+        timeout: Maximum execution time in seconds
+        use_cache: Whether a cached result may be returned
+        
+    Returns:
+        The crawler result, and the seconds left before it expires if it
+        came from the cache (None otherwise)
+    """
+    if use_cache:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            result, expires = cached
+            return result, max(int(expires - time.monotonic()), 0)
+    
+    result = await run_crawler(args, timeout=timeout)
+    
+    # Only cache results that actually contain a page
+    if result["data"]:
+        _result_cache[key] = (result, time.monotonic() + RESULT_CACHE_TTL)
+    
+    return result, None
 
 
 # ============================================================================
@@ -265,7 +637,22 @@ async def health_check():
     """
     Health check endpoint.
     
-    Returns the API status and whether the crawler binary is available.
+    Returns the API status and whether the crawler binary was available
+    at startup.
+    """
+    return HealthResponse(
+        status="healthy",
+        version="1.0.0",
+        crawler_available=app.state.crawler_available
+    )
+
+
+@app.get("/health/deep", response_model=HealthResponse, tags=["Health"])
+async def deep_health_check():
+    """
+    Deep health check endpoint.
+    
+    Like `/health`, but checks the crawler binary on disk on every call.
     """
     return HealthResponse(
         status="healthy",
@@ -276,16 +663,19 @@ async def health_check():
 
 @app.post(
     "/crawl",
-    response_model=CrawlResponse,
     responses={
-        200: {"description": "Successful crawl"},
+        200: {
+            "model": CrawlResponse,
+            "description": "Successful crawl",
+            "content": {"application/x-ndjson": {}}
+        },
         400: {"model": ErrorResponse, "description": "Invalid request"},
         500: {"model": ErrorResponse, "description": "Crawler error"},
         504: {"model": ErrorResponse, "description": "Timeout"}
     },
     tags=["Crawling"]
 )
-async def crawl_website(request: CrawlRequest):
+async def crawl_website(request: CrawlRequest, http_request: Request):
     """
     Crawl a website with full control over all crawling parameters.
     
@@ -306,60 +696,57 @@ async def crawl_website(request: CrawlRequest):
     - **delay**: Delay between requests in seconds, 0-10 (default: 1)
     - **timeout**: Request timeout in seconds, 5-60 (default: 10)
     - **verbose**: Enable verbose output (default: false)
+    
+    Send `Accept: application/x-ndjson` to receive pages as newline-delimited
+    JSON while they are crawled instead of a single response at the end.
     """
     # Build crawler arguments
     crawler_args = ["-seed", request.url]
     
-    if request.extract_links:
-        crawler_args.append("-extract-links")
-    
-    crawler_args.extend(["-depth", str(request.depth)])
-    crawler_args.extend(["-max", str(request.max_pages)])
-    crawler_args.extend(["-workers", str(request.workers)])
+    for name, flag, fmt in _CRAWL_ARG_SPEC:
+        value = getattr(request, name)
+        if fmt is None:
+            if value:
+                crawler_args.append(flag)
+        elif value is not None and value != "":
+            crawler_args.extend((flag, fmt(value)))
     
     if not request.stay_domain:
         crawler_args.append("-stay-domain=false")
     
-    if request.filter:
-        crawler_args.extend(["-filter", request.filter])
-    
-    if request.seed_only:
-        crawler_args.append("-seed-only")
-    
-    if request.news:
-        crawler_args.append("-news")
-    
-    crawler_args.extend(["-delay", str(request.delay)])
-    crawler_args.extend(["-timeout", str(request.timeout)])
-    
-    if request.verbose:
-        crawler_args.append("-verbose")
-    
     # Calculate timeout (give extra time for the subprocess)
     execution_timeout = request.timeout * request.max_pages + 30
     
+    # Stream pages as they are crawled when the client asks for NDJSON
+    if "application/x-ndjson" in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            stream_crawler(_get_pool(), crawler_args, timeout=execution_timeout),
+            media_type="application/x-ndjson"
+        )
+    
     # Run the crawler
     result = await run_crawler(crawler_args, timeout=execution_timeout)
     
-    return CrawlResponse(
-        pages_crawled=len(result["data"]),
-        pages=result["data"],
-        execution_time_seconds=result["execution_time"]
-    )
+    # The crawler output is trusted, so skip model validation and only
+    # fill in the optional fields the crawler omits
+    return ORJSONResponse({
+        "pages_crawled": len(result["data"]),
+        "pages": [{**_PAGE_DEFAULTS, **page} for page in result["data"]],
+        "execution_time_seconds": result["execution_time"]
+    })
 
 
 @app.post(
     "/scrape",
-    response_model=ScrapeResponse,
     responses={
-        200: {"description": "Successful scrape"},
+        200: {"model": ScrapeResponse, "description": "Successful scrape"},
         400: {"model": ErrorResponse, "description": "Invalid request"},
         500: {"model": ErrorResponse, "description": "Scraper error"},
         504: {"model": ErrorResponse, "description": "Timeout"}
     },
     tags=["Scraping"]
 )
-async def scrape_page(request: ScrapeRequest):
+async def scrape_page(request: ScrapeRequest, http_request: Request):
     """
     Quickly scrape a single page and extract its content.
     
@@ -370,6 +757,9 @@ async def scrape_page(request: ScrapeRequest):
     **Parameters:**
     - **url**: The URL to scrape (required)
     - **extract_links**: Also extract links (default: false)
+    
+    Results are cached for a few minutes; send `Cache-Control: no-cache`
+    to force a fresh scrape.
     """
     # Use seed-only mode for quick scraping
     crawler_args = ["-seed", request.url, "-seed-only"]
@@ -378,7 +768,13 @@ async def scrape_page(request: ScrapeRequest):
         crawler_args.append("-extract-links")
     
     # Run the crawler with a shorter timeout
-    result = await run_crawler(crawler_args, timeout=30)
+    result, max_age = await cached_run(
+        _cache_key(crawler_args),
+        crawler_args,
+        timeout=30,
+        use_cache=not _bypass_cache(http_request)
+    )
+    headers = {"Cache-Control": f"max-age={max_age}"} if max_age is not None else None
     
     if not result["data"]:
         raise HTTPException(
@@ -389,21 +785,59 @@ async def scrape_page(request: ScrapeRequest):
     # Return the first (and only) page
     page = result["data"][0]
     
-    return ScrapeResponse(**page)
+    return ORJSONResponse({**_PAGE_DEFAULTS, **page}, headers=headers)
+
+
+@app.post(
+    "/scrape/batch",
+    responses={
+        200: {
+            "description": "One scraped page or error per line, as each scrape finishes",
+            "content": {"application/x-ndjson": {}}
+        },
+        400: {"model": ErrorResponse, "description": "Invalid request"}
+    },
+    tags=["Scraping"]
+)
+async def scrape_batch(request: BatchScrapeRequest):
+    """
+    Scrape several pages in one request.
+    
+    All pages are scraped concurrently by a single crawler process, and
+    results are streamed back as newline-delimited JSON as each page
+    finishes. Use this instead of calling `/scrape` in a loop.
+    
+    **Parameters:**
+    - **urls**: The URLs to scrape, 1-100 (required)
+    - **extract_links**: Also extract links from each page (default: false)
+    """
+    batch = []
+    for url in request.urls:
+        crawler_args = ["-seed", url, "-seed-only"]
+        if request.extract_links:
+            crawler_args.append("-extract-links")
+        batch.append(crawler_args)
+    
+    # Allow as long as scraping every page one after another would take
+    timeout = 30 * len(batch)
+    
+    return StreamingResponse(
+        stream_batch_scrape(_get_pool(), request.urls, batch, timeout=timeout),
+        media_type="application/x-ndjson"
+    )
 
 
 @app.post(
     "/links",
-    response_model=LinksResponse,
     responses={
-        200: {"description": "Successfully extracted links"},
+        200: {"model": LinksResponse, "description": "Successfully extracted links"},
         400: {"model": ErrorResponse, "description": "Invalid request"},
         500: {"model": ErrorResponse, "description": "Extraction error"},
         504: {"model": ErrorResponse, "description": "Timeout"}
     },
     tags=["Link Extraction"]
 )
-async def extract_links(request: LinksRequest):
+async def extract_links(request: LinksRequest, http_request: Request):
     """
     Extract all links from a single page.
     
@@ -412,12 +846,21 @@ async def extract_links(request: LinksRequest):
     
     **Parameters:**
     - **url**: The URL to extract links from (required)
+    
+    Results are cached for a few minutes; send `Cache-Control: no-cache`
+    to force a fresh extraction.
     """
     # Use seed-only mode with link extraction
     crawler_args = ["-seed", request.url, "-seed-only", "-extract-links"]
     
     # Run the crawler
-    result = await run_crawler(crawler_args, timeout=30)
+    result, max_age = await cached_run(
+        _cache_key(crawler_args),
+        crawler_args,
+        timeout=30,
+        use_cache=not _bypass_cache(http_request)
+    )
+    headers = {"Cache-Control": f"max-age={max_age}"} if max_age is not None else None
     
     if not result["data"]:
         raise HTTPException(
@@ -429,11 +872,11 @@ async def extract_links(request: LinksRequest):
     page = result["data"][0]
     links = page.get("links", [])
     
-    return LinksResponse(
-        url=request.url,
-        links_found=len(links),
-        links=links
-    )
+    return ORJSONResponse({
+        "url": request.url,
+        "links_found": len(links),
+        "links": links
+    }, headers=headers)
 
 
 # ============================================================================
@@ -465,16 +908,29 @@ async def general_exception_handler(request, exc):
 
 @app.on_event("startup")
 async def startup_event():
-    """Log startup information"""
+    """Log startup information and start the crawler workers"""
     logger.info("Web Crawler API starting up")
     logger.info(f"Crawler binary: {CRAWLER_BINARY}")
-    logger.info(f"Binary exists: {CRAWLER_BINARY.exists()}")
+    
+    # The binary is fixed for the life of the process, so check it once
+    app.state.crawler_available = CRAWLER_BINARY.exists()
+    logger.info(f"Binary exists: {app.state.crawler_available}")
+    
+    if app.state.crawler_available:
+        pool = CrawlerPool(CRAWLER_POOL_SIZE)
+        await pool.start()
+        app.state.crawler_pool = pool
+        logger.info(f"Started {CRAWLER_POOL_SIZE} crawler workers")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log shutdown information"""
+    """Log shutdown information and stop the crawler workers"""
     logger.info("Web Crawler API shutting down")
+    
+    pool: Optional[CrawlerPool] = getattr(app.state, "crawler_pool", None)
+    if pool is not None:
+        await pool.stop()
 
 
 # ============================================================================
@@ -483,5 +939,13 @@ async def shutdown_event():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080, log_level="info")
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8080,
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
 
@@ -15,42 +15,99 @@ import (
 	"github.com/user/gocrawler/pkg/storage"
 )
 
+type options struct {
+	seedURL       string
+	outputFile    string
+	outputFormat  string
+	workerCount   int
+	depth         int
+	delay         int
+	timeout       int
+	respectRobots bool
+	newsOnly      bool
+	maxPages      int
+	userAgent     string
+	verbose       bool
+	stayOnDomain  bool
+	urlFilter     string
+	seedOnly      bool
+	extractLinks  bool
+	serverMode    bool
+}
+
+func newFlagSet(name string, errorHandling flag.ErrorHandling) (*flag.FlagSet, *options) {
+	opts := &options{}
+	fs := flag.NewFlagSet(name, errorHandling)
+
+	fs.StringVar(&opts.seedURL, "seed", "", "Seed URL to start crawling from (required)")
+	fs.StringVar(&opts.outputFile, "output", "results.json", "Output file name (use - for stdout)")
+	fs.StringVar(&opts.outputFormat, "format", "json", "Output format: json or csv")
+	fs.IntVar(&opts.workerCount, "workers", 2, "Number of concurrent workers")
+	fs.IntVar(&opts.depth, "depth", 1, "Maximum crawl depth")
+	fs.IntVar(&opts.delay, "delay", 1, "Delay between requests in seconds")
+	fs.IntVar(&opts.timeout, "timeout", 10, "Request timeout in seconds")
+	fs.BoolVar(&opts.respectRobots, "robots", true, "Respect robots.txt")
+	fs.BoolVar(&opts.newsOnly, "news", false, "Extract only news article content")
+	fs.IntVar(&opts.maxPages, "max", 20, "Maximum number of pages to crawl")
+	fs.StringVar(&opts.userAgent, "agent", "GoCrawler/1.0", "User-Agent string")
+	fs.BoolVar(&opts.verbose, "verbose", false, "Verbose output")
+	fs.BoolVar(&opts.stayOnDomain, "stay-domain", true, "Stay on the same domain as the seed URL")
+	fs.StringVar(&opts.urlFilter, "filter", "", "Only crawl URLs containing this string (e.g., '/wiki/')")
+	fs.BoolVar(&opts.seedOnly, "seed-only", false, "Crawl only the seed URL, don't follow any links")
+	fs.BoolVar(&opts.extractLinks, "extract-links", false, "Extract links from crawled pages")
+	fs.BoolVar(&opts.serverMode, "server", false, "Serve crawl requests as line-delimited JSON over stdin/stdout")
+
+	return fs, opts
+}
+
+func (o *options) crawlerConfig() crawler.Config {
+	return crawler.Config{
+		MaxDepth:      o.depth,
+		WorkerCount:   o.workerCount,
+		Delay:         time.Duration(o.delay) * time.Second,
+		Timeout:       time.Duration(o.timeout) * time.Second,
+		MaxPages:      o.maxPages,
+		RespectRobots: o.respectRobots,
+		UserAgent:     o.userAgent,
+		NewsOnly:      o.newsOnly,
+		Verbose:       o.verbose,
+		StayOnDomain:  o.stayOnDomain,
+		URLFilter:     o.urlFilter,
+		SeedOnly:      o.seedOnly,
+		ExtractLinks:  o.extractLinks,
+	}
+}
+
 func main() {
-	seedURL := flag.String("seed", "", "Seed URL to start crawling from (required)")
-	outputFile := flag.String("output", "results.json", "Output file name")
-	outputFormat := flag.String("format", "json", "Output format: json or csv")
-	workerCount := flag.Int("workers", 2, "Number of concurrent workers")
-	depth := flag.Int("depth", 1, "Maximum crawl depth")
-	delay := flag.Int("delay", 1, "Delay between requests in seconds")
-	timeout := flag.Int("timeout", 10, "Request timeout in seconds")
-	respectRobots := flag.Bool("robots", true, "Respect robots.txt")
-	newsOnly := flag.Bool("news", false, "Extract only news article content")
-	maxPages := flag.Int("max", 20, "Maximum number of pages to crawl")
-	userAgent := flag.String("agent", "GoCrawler/1.0", "User-Agent string")
-	verbose := flag.Bool("verbose", false, "Verbose output")
-	stayOnDomain := flag.Bool("stay-domain", true, "Stay on the same domain as the seed URL")
-	urlFilter := flag.String("filter", "", "Only crawl URLs containing this string (e.g., '/wiki/')")
-	seedOnly := flag.Bool("seed-only", false, "Crawl only the seed URL, don't follow any links")
-	extractLinks := flag.Bool("extract-links", false, "Extract links from crawled pages")
-
-	flag.Parse()
-
-	if *seedURL == "" {
+	fs, opts := newFlagSet(os.Args[0], flag.ExitOnError)
+	fs.Parse(os.Args[1:])
+
+	if opts.serverMode {
+		// Responses go to stdout; keep progress messages off it.
+		out := os.Stdout
+		os.Stdout = os.Stderr
+		if err := runServer(os.Stdin, out); err != nil {
+			log.Fatalf("Server error: %v", err)
+		}
+		return
+	}
+
+	if opts.seedURL == "" {
 		fmt.Println("Error: seed URL is required")
-		flag.Usage()
+		fs.Usage()
 		os.Exit(1)
 	}
 
 	var store storage.Storage
 	var err error
-	switch *outputFormat {
+	switch opts.outputFormat {
 	case "json":
-		store, err = storage.NewJSONStorage(*outputFile)
+		store, err = storage.NewJSONStorage(opts.outputFile)
 	case "csv":
-		store, err = storage.NewCSVStorage(*outputFile)
+		store, err = storage.NewCSVStorage(opts.outputFile)
 	default:
-		fmt.Printf("Unsupported output format: %s, defaulting to JSON\n", *outputFormat)
-		store, err = storage.NewJSONStorage(*outputFile)
+		fmt.Printf("Unsupported output format: %s, defaulting to JSON\n", opts.outputFormat)
+		store, err = storage.NewJSONStorage(opts.outputFile)
 	}
 
 	if err != nil {
@@ -58,26 +115,16 @@ func main() {
 	}
 	defer store.Close()
 
-	urlFrontier := frontier.NewURLFrontier()
-	urlFrontier.Add(*seedURL, 0)
-
-	crawlerConfig := crawler.Config{
-		MaxDepth:      *depth,
-		WorkerCount:   *workerCount,
-		Delay:         time.Duration(*delay) * time.Second,
-		Timeout:       time.Duration(*timeout) * time.Second,
-		MaxPages:      *maxPages,
-		RespectRobots: *respectRobots,
-		UserAgent:     *userAgent,
-		NewsOnly:      *newsOnly,
-		Verbose:       *verbose,
-		StayOnDomain:  *stayOnDomain,
-		URLFilter:     *urlFilter,
-		SeedOnly:      *seedOnly,
-		ExtractLinks:  *extractLinks,
+	// When results are written to stdout, send progress messages to stderr so
+	// the output stays machine-readable.
+	if opts.outputFile == storage.StdoutName {
+		os.Stdout = os.Stderr
 	}
 
-	c := crawler.New(crawlerConfig, urlFrontier, store)
+	urlFrontier := frontier.NewURLFrontier()
+	urlFrontier.Add(opts.seedURL, 0)
+
+	c := crawler.New(opts.crawlerConfig(), urlFrontier, store)
 
 	sigChan := make(chan os.Signal, 1)
 	signal.Notify(sigChan, syscall.SIGINT, syscall.SIGTERM)
@@ -100,5 +147,5 @@ func main() {
 	}
 
 	wg.Wait()
-	fmt.Printf("Crawled %d pages. Results saved to %s\n", c.Stats().PagesCrawled, *outputFile)
+	fmt.Printf("Crawled %d pages. Results saved to %s\n", c.Stats().PagesCrawled, opts.outputFile)
 }
@@ -7,14 +7,15 @@ It wraps the Go web crawler binary and provides structured tools for web scrapin
 """
 
 import asyncio
-import json
+import hashlib
 import os
-import subprocess
-import tempfile
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlparse
 
+import orjson
+from cachetools import TTLCache
+
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 import mcp.server.stdio
@@ -31,9 +32,47 @@ if not CRAWLER_BINARY.exists():
         "Please build the Go crawler first with: go build -o gocrawler"
     )
 
+# URL prefixes accepted by validate_url
+_URL_SCHEMES = ('http://', 'https://')
+
+# Characters that urlparse strips or validates specially, sending a URL
+# down validate_url's full parse
+_URL_PARSE_CHARS = frozenset('\t\r\n[]')
+
+# Cache of recent single-page results so repeat scrapes of the same URL
+# skip the crawl entirely
+RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", "300"))
+_result_cache: TTLCache = TTLCache(maxsize=1024, ttl=RESULT_CACHE_TTL)
+
+# Maximum number of crawler processes running at once
+_CRAWLER_SEM = asyncio.Semaphore(int(os.getenv("CRAWLER_CONCURRENCY", "16")))
+
+# crawl_website arguments that map onto crawler flags, as (field, flag, formatter).
+# Fields without a formatter are boolean switches emitted only when set.
+_CRAWL_ARG_SPEC = (
+    ("extract_links", "-extract-links", None),
+    ("depth", "-depth", str),
+    ("max_pages", "-max", str),
+    ("workers", "-workers", str),
+    ("filter", "-filter", str),
+    ("seed_only", "-seed-only", None),
+    ("news", "-news", None),
+    ("delay", "-delay", str),
+    ("timeout", "-timeout", str),
+    ("verbose", "-verbose", None),
+)
+
 
 def validate_url(url: str) -> bool:
     """Validate that a URL is well-formed."""
+    # Check plain ASCII URLs, the common case, directly instead of building
+    # a full urlparse result. Anything urlparse would clean up or reject
+    # first (leading whitespace, tabs and newlines, IPv6 brackets,
+    # non-ASCII hosts) still gets the full parse.
+    if (url[:8].lower().startswith(_URL_SCHEMES) and url.isascii()
+            and _URL_PARSE_CHARS.isdisjoint(url)):
+        rest = url[url.index('://') + 3:]
+        return bool(rest) and rest[0] not in '/?#'
     try:
         result = urlparse(url)
         return all([result.scheme in ('http', 'https'), result.netloc])
@@ -55,13 +94,10 @@ async def run_crawler(args: list[str], timeout: int = 60) -> dict[str, Any]:
     Raises:
         RuntimeError: If the crawler fails or times out
     """
-    # Create a temporary file for the output
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-        output_file = tmp.name
-    
-    try:
-        # Build the command
-        cmd = [str(CRAWLER_BINARY), "-output", output_file] + args
+    # Wait for a free slot so bursts of calls can't spawn unbounded processes
+    async with _CRAWLER_SEM:
+        # Build the command; the crawler writes its JSON results to stdout
+        cmd = [str(CRAWLER_BINARY), "-output", "-"] + args
         
         # Run the crawler
         process = await asyncio.create_subprocess_exec(
@@ -77,6 +113,7 @@ async def run_crawler(args: list[str], timeout: int = 60) -> dict[str, Any]:
             )
         except asyncio.TimeoutError:
             process.kill()
+            await process.wait()
             raise RuntimeError(f"Crawler timed out after {timeout} seconds")
         
         # Check if the process succeeded
@@ -84,18 +121,24 @@ async def run_crawler(args: list[str], timeout: int = 60) -> dict[str, Any]:
             error_msg = stderr.decode('utf-8') if stderr else "Unknown error"
             raise RuntimeError(f"Crawler failed: {error_msg}")
         
-        # Read and parse the output
-        with open(output_file, 'r') as f:
-            result = json.load(f)
-        
-        return result
-        
-    finally:
-        # Clean up the temporary file
-        try:
-            os.unlink(output_file)
-        except Exception:
-            pass
+        # Parse the output
+        return orjson.loads(stdout)
+
+
+async def cached_run_crawler(args: list[str], timeout: int = 60) -> dict[str, Any]:
+    """Run the crawler, serving repeat requests from the result cache."""
+    key = hashlib.blake2b(orjson.dumps(args), digest_size=16).digest()
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    result = await run_crawler(args, timeout=timeout)
+    
+    # Only cache results that actually contain a page
+    if result:
+        _result_cache[key] = result
+    
+    return result
 
 
 # Initialize the MCP server
@@ -260,39 +303,17 @@ async def handle_crawl_website(args: dict[str, Any]) -> list[TextContent]:
     # Build crawler arguments
     crawler_args = ["-seed", url]
     
-    if args.get("extract_links", False):
-        crawler_args.append("-extract-links")
-    
-    if "depth" in args:
-        crawler_args.extend(["-depth", str(args["depth"])])
-    
-    if "max_pages" in args:
-        crawler_args.extend(["-max", str(args["max_pages"])])
-    
-    if "workers" in args:
-        crawler_args.extend(["-workers", str(args["workers"])])
+    for name, flag, fmt in _CRAWL_ARG_SPEC:
+        value = args.get(name)
+        if fmt is None:
+            if value:
+                crawler_args.append(flag)
+        elif value is not None and value != "":
+            crawler_args.extend((flag, fmt(value)))
     
     if args.get("stay_domain") is False:
         crawler_args.append("-stay-domain=false")
     
-    if "filter" in args and args["filter"]:
-        crawler_args.extend(["-filter", args["filter"]])
-    
-    if args.get("seed_only", False):
-        crawler_args.append("-seed-only")
-    
-    if args.get("news", False):
-        crawler_args.append("-news")
-    
-    if "delay" in args:
-        crawler_args.extend(["-delay", str(args["delay"])])
-    
-    if "timeout" in args:
-        crawler_args.extend(["-timeout", str(args["timeout"])])
-    
-    if args.get("verbose", False):
-        crawler_args.append("-verbose")
-    
     # Calculate timeout (give extra time for the subprocess)
     execution_timeout = args.get("timeout", 10) * args.get("max_pages", 20) + 30
     
@@ -308,7 +329,7 @@ async def handle_crawl_website(args: dict[str, Any]) -> list[TextContent]:
         
         return [TextContent(
             type="text",
-            text=json.dumps(response, indent=2)
+            text=orjson.dumps(response, option=orjson.OPT_INDENT_2).decode()
         )]
     
     except Exception as e:
@@ -335,7 +356,7 @@ async def handle_quick_scrape(args: dict[str, Any]) -> list[TextContent]:
     
     # Run the crawler with a shorter timeout
     try:
-        result = await run_crawler(crawler_args, timeout=30)
+        result = await cached_run_crawler(crawler_args, timeout=30)
         
         if not result:
             return [TextContent(
@@ -348,7 +369,7 @@ async def handle_quick_scrape(args: dict[str, Any]) -> list[TextContent]:
         
         return [TextContent(
             type="text",
-            text=json.dumps(page, indent=2)
+            text=orjson.dumps(page, option=orjson.OPT_INDENT_2).decode()
         )]
     
     except Exception as e:
@@ -372,7 +393,7 @@ async def handle_get_page_links(args: dict[str, Any]) -> list[TextContent]:
     
     # Run the crawler
     try:
-        result = await run_crawler(crawler_args, timeout=30)
+        result = await cached_run_crawler(crawler_args, timeout=30)
         
         if not result:
             return [TextContent(
@@ -392,7 +413,7 @@ async def handle_get_page_links(args: dict[str, Any]) -> list[TextContent]:
         
         return [TextContent(
             type="text",
-            text=json.dumps(response, indent=2)
+            text=orjson.dumps(response, option=orjson.OPT_INDENT_2).decode()
         )]
     
     except Exception as e:
@@ -1,63 +1,259 @@
 #!/usr/bin/env python3
 """
-MCP Server for Go Web Crawler (HTTP/SSE Transport)
+MCP Server for Go Web Crawler (HTTP Transport)
 
 This server exposes web crawling capabilities to LLMs via the Model Context Protocol
-using HTTP/SSE transport for remote access. It calls the Crawler REST API instead of
+using the Streamable HTTP (or legacy SSE) transport for remote access. It calls the Crawler REST API instead of
 running the binary directly.
 """
 
+import asyncio
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache, partial
+from typing import Dict, Optional, Union
 from urllib.parse import urlparse
-import json
 
 import httpx
+import orjson
+import uvicorn
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
 
 # Get the Crawler API URL from environment variable
 CRAWLER_API_URL = os.getenv("CRAWLER_API_URL", "http://localhost:8080")
 
+# Transport served over HTTP: "streamable-http" (at /mcp), "sse" (legacy,
+# at /sse), or "all" to serve both
+MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "streamable-http")
+MCP_TRANSPORTS = ("streamable-http", "sse", "all")
+
+# Uvicorn worker processes (validated in main()). Sessions can't be shared
+# between processes, so with more than one worker Streamable HTTP runs
+# statelessly and the SSE transport is unavailable.
+MCP_WORKERS = os.getenv("MCP_WORKERS", "1")
+
+# Maximum concurrent connections and requests before Uvicorn answers 503
+# (unlimited if unset; validated in main())
+MCP_LIMIT_CONCURRENCY = os.getenv("MCP_LIMIT_CONCURRENCY")
+
 # Initialize FastMCP server
 mcp = FastMCP("web-crawler")
 
+# Maximum concurrent requests to the Crawler API, across all MCP clients
+CRAWLER_MAX_INFLIGHT = int(os.getenv("CRAWLER_MAX_INFLIGHT", "32"))
+_UPSTREAM_SEM = asyncio.Semaphore(CRAWLER_MAX_INFLIGHT)
+
+# Cache of recent quick_scrape and get_page_links responses so repeat
+# requests for the same URL skip the Crawler API entirely
+MCP_CACHE_TTL = int(os.getenv("MCP_CACHE_TTL", "300"))
+_result_cache: TTLCache = TTLCache(maxsize=1024, ttl=MCP_CACHE_TTL)
+
+# Attempts per Crawler API call, and the upstream statuses worth retrying
+# (a proxy in front of the API failing, or the API having no crawler yet)
+CRAWLER_API_ATTEMPTS = 3
+_RETRY_STATUSES = frozenset((502, 503))
+
+# Crawler API calls currently in flight, keyed on the endpoint and request,
+# so identical concurrent calls share one request
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+# Shared client for the Crawler API, created on first use so connections
+# are kept alive and reused across tool calls
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Crawler API client, creating it if needed."""
+    global _client
+    if _client is None:
+        # The transport retries failed connection attempts on its own
+        _client = httpx.AsyncClient(
+            base_url=CRAWLER_API_URL,
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(
+                    max_keepalive_connections=CRAWLER_MAX_INFLIGHT,
+                    max_connections=CRAWLER_MAX_INFLIGHT,
+                    keepalive_expiry=120.0
+                ),
+                http2=True
+            )
+        )
+    return _client
+
+
+# Pretty-print tool responses serialized here (set MCP_JSON_INDENT=1); they
+# are compact by default, like the API responses passed through as-is
+_DUMPS_OPTION = orjson.OPT_INDENT_2 if os.getenv("MCP_JSON_INDENT", "0") == "1" else 0
+
+
+def _dumps(obj) -> str:
+    """Serialize a tool response as JSON."""
+    return orjson.dumps(obj, option=_DUMPS_OPTION).decode()
+
+
+# Threads in the event loop's default executor. The server does no blocking
+# work of its own, so this only guards against anything that uses the
+# executor later.
+EXECUTOR_THREADS = 4
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """
+    Run the Streamable HTTP session manager while the server is up, and
+    manage the shared Crawler API client.
+    
+    The client's first connection is opened at startup so the first tool
+    call doesn't pay for the handshake, and the client is closed on
+    shutdown.
+    """
+    global _client
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=EXECUTOR_THREADS)
+    )
+    
+    try:
+        await _get_client().get("/health", timeout=5.0)
+    except httpx.HTTPError as e:
+        print(f"Could not pre-warm Crawler API connection: {e!r}")
+    
+    async with AsyncExitStack() as stack:
+        if MCP_TRANSPORT != "sse":
+            await stack.enter_async_context(mcp.session_manager.run())
+        yield
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# URL prefixes accepted by validate_url
+_URL_SCHEMES = ('http://', 'https://')
+
 
+@lru_cache(maxsize=4096)
 def validate_url(url: str) -> bool:
     """Validate that a URL is well-formed."""
+    # Reject anything without an http(s) scheme before the full parse
+    if not url[:8].lower().startswith(_URL_SCHEMES):
+        return False
     try:
-        result = urlparse(url)
-        return all([result.scheme in ('http', 'https'), result.netloc])
+        return bool(urlparse(url).netloc)
     except Exception:
         return False
 
 
-async def call_crawler_api(endpoint: str, data: dict) -> dict:
+def _finish_inflight(key: tuple, task: asyncio.Task):
+    """Forget a finished shared call and mark its exception as retrieved."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def call_crawler_api(endpoint: str, data: dict, raw: bool = False) -> Union[dict, bytes]:
     """
     Call the Crawler REST API.
     
+    Concurrent calls with identical requests share a single API call: only
+    the first one is sent, and the others wait for its response.
+    
     Args:
         endpoint: API endpoint to call (e.g., '/crawl', '/scrape', '/links')
         data: Request data to send
+        raw: Return the undecoded JSON response body instead of parsing it
         
     Returns:
-        API response data
+        API response data, or the raw response body if raw is set
         
     Raises:
         Exception: If the API call fails
     """
-    async with httpx.AsyncClient(timeout=300.0) as client:
+    key = (endpoint, raw, tuple(sorted(data.items())))
+    
+    task = _inflight.get(key)
+    if task is None:
+        # Run the call as its own task so that cancelling any caller, the
+        # first one included, can't cancel it for the others
+        task = asyncio.create_task(_call_crawler_api(endpoint, data, raw))
+        task.add_done_callback(partial(_finish_inflight, key))
+        _inflight[key] = task
+    return await asyncio.shield(task)
+
+
+async def _call_crawler_api(endpoint: str, data: dict, raw: bool) -> Union[dict, bytes]:
+    """Call the Crawler REST API, retrying transient failures."""
+    async with _UPSTREAM_SEM:
         try:
-            response = await client.post(
-                f"{CRAWLER_API_URL}{endpoint}",
-                json=data
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text
-            raise Exception(f"Crawler API error: {error_detail}")
+            # Retry dropped keep-alive connections and transient upstream
+            # errors with exponential backoff
+            for attempt in range(CRAWLER_API_ATTEMPTS):
+                last_attempt = attempt == CRAWLER_API_ATTEMPTS - 1
+                try:
+                    response = await _get_client().post(endpoint, json=data)
+                except httpx.RemoteProtocolError:
+                    if last_attempt:
+                        raise
+                else:
+                    if last_attempt or response.status_code not in _RETRY_STATUSES:
+                        break
+                await asyncio.sleep(0.1 * 2 ** attempt)
         except Exception as e:
             raise Exception(f"Failed to call Crawler API: {str(e)}")
+    
+    if response.status_code >= 400:
+        # Report only the start of the error body, however large it is
+        error_detail = response.content[:1024].decode('utf-8', errors='replace')
+        raise Exception(f"Crawler API error: {error_detail}")
+    
+    if raw:
+        return response.content
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise Exception(f"Failed to call Crawler API: {str(e)}")
+
+
+async def cached_call_crawler_api(endpoint: str, data: dict) -> str:
+    """
+    Call the Crawler REST API, serving repeat requests from the result cache.
+    
+    Returns:
+        The API's JSON response body as a string
+    """
+    key = (endpoint, tuple(sorted(data.items())))
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    result = (await call_crawler_api(endpoint, data, raw=True)).decode()
+    _result_cache[key] = result
+    return result
+
+
+# Crawl API request defaults; crawl_website only sends values that differ
+_CRAWL_DEFAULTS = {
+    "extract_links": False,
+    "depth": 1,
+    "max_pages": 20,
+    "workers": 2,
+    "stay_domain": True,
+    "seed_only": False,
+    "news": False,
+    "delay": 1,
+    "timeout": 10,
+    "verbose": False
+}
+
+
+def _check(name: str, value: int, lo: int, hi: int) -> None:
+    """Raise ValueError unless lo <= value <= hi."""
+    if not lo <= value <= hi:
+        raise ValueError(f"{name} must be between {lo} and {hi}")
 
 
 @mcp.tool()
@@ -100,22 +296,26 @@ async def crawl_website(
         JSON string with crawl results
     """
     if not validate_url(url):
-        return json.dumps({"error": f"Invalid URL: {url}"})
-    
-    # Prepare request data for the API
-    request_data = {
-        "url": url,
-        "extract_links": extract_links,
-        "depth": depth,
-        "max_pages": max_pages,
-        "workers": workers,
-        "stay_domain": stay_domain,
-        "seed_only": seed_only,
-        "news": news,
-        "delay": delay,
-        "timeout": timeout,
-        "verbose": verbose
-    }
+        return _dumps({"error": f"Invalid URL: {url}"})
+    
+    # Reject out-of-range values here rather than in a round trip to the API
+    try:
+        _check("depth", depth, 0, 5)
+        _check("max_pages", max_pages, 1, 100)
+        _check("workers", workers, 1, 10)
+        _check("delay", delay, 0, 10)
+        _check("timeout", timeout, 5, 60)
+    except ValueError as e:
+        return _dumps({"error": str(e)})
+    
+    # Prepare request data for the API, sending only values that differ
+    # from the API's own defaults
+    params = locals()
+    request_data = {"url": url}
+    for key, default in _CRAWL_DEFAULTS.items():
+        value = params[key]
+        if value != default:
+            request_data[key] = value
     
     # Add filter if provided
     if filter:
@@ -123,10 +323,11 @@ async def crawl_website(
     
     # Call the Crawler API
     try:
-        result = await call_crawler_api("/crawl", request_data)
-        return json.dumps(result, indent=2)
+        # Pass the API's JSON through as-is rather than re-serializing it
+        result = await call_crawler_api("/crawl", request_data, raw=True)
+        return result.decode()
     except Exception as e:
-        return json.dumps({"error": f"Error crawling website: {str(e)}"})
+        return _dumps({"error": f"Error crawling website: {str(e)}"})
 
 
 @mcp.tool()
@@ -149,20 +350,75 @@ async def quick_scrape(
         JSON string with page data
     """
     if not validate_url(url):
-        return json.dumps({"error": f"Invalid URL: {url}"})
+        return _dumps({"error": f"Invalid URL: {url}"})
     
-    # Prepare request data
-    request_data = {
-        "url": url,
-        "extract_links": extract_links
-    }
+    # Prepare request data, leaving out the API's defaults
+    request_data = {"url": url}
+    if extract_links:
+        request_data["extract_links"] = True
     
     # Call the Crawler API
     try:
-        result = await call_crawler_api("/scrape", request_data)
-        return json.dumps(result, indent=2)
+        # Pass the API's JSON through as-is rather than re-serializing it
+        return await cached_call_crawler_api("/scrape", request_data)
     except Exception as e:
-        return json.dumps({"error": f"Error scraping page: {str(e)}"})
+        return _dumps({"error": f"Error scraping page: {str(e)}"})
+
+
+# Most URLs accepted by one quick_scrape_many call, as for the API's
+# /scrape/batch
+MAX_SCRAPE_URLS = 100
+
+# Upper bound on concurrent scrapes for a single quick_scrape_many call
+MAX_SCRAPE_CONCURRENCY = 50
+
+
+@mcp.tool()
+async def quick_scrape_many(
+    urls: list[str],
+    extract_links: bool = False,
+    concurrency: int = 10
+) -> str:
+    """
+    Quickly scrape several pages at once and extract their content.
+    
+    Use this instead of calling quick_scrape repeatedly when you need
+    the title, description, and text content of many pages. Pages are
+    scraped concurrently.
+    
+    Args:
+        urls: The URLs to scrape, at most 100 (required)
+        extract_links: Also extract links from each page (default: false)
+        concurrency: Maximum pages scraped at once, 1-50 (default: 10)
+    
+    Returns:
+        JSON string with a list of page data, one entry per URL in the
+        order given; pages that failed have an "error" field instead
+    """
+    if len(urls) > MAX_SCRAPE_URLS:
+        return _dumps({"error": f"Too many URLs: at most {MAX_SCRAPE_URLS} allowed"})
+    for url in urls:
+        if not validate_url(url):
+            return _dumps({"error": f"Invalid URL: {url}"})
+    
+    sem = asyncio.Semaphore(max(1, min(concurrency, MAX_SCRAPE_CONCURRENCY)))
+    
+    async def scrape_one(url: str) -> str:
+        # Prepare request data as quick_scrape does, so both share cached
+        # and in-flight responses
+        request_data = {"url": url}
+        if extract_links:
+            request_data["extract_links"] = True
+        
+        async with sem:
+            try:
+                return await cached_call_crawler_api("/scrape", request_data)
+            except Exception as e:
+                return _dumps({"url": url, "error": f"Error scraping page: {str(e)}"})
+    
+    # Join the API's JSON for each page as-is rather than re-serializing it
+    results = await asyncio.gather(*(scrape_one(url) for url in urls))
+    return "[" + ",".join(results) + "]"
 
 
 @mcp.tool()
@@ -180,38 +436,91 @@ async def get_page_links(url: str) -> str:
         JSON string with links data
     """
     if not validate_url(url):
-        return json.dumps({"error": f"Invalid URL: {url}"})
+        return _dumps({"error": f"Invalid URL: {url}"})
     
     # Prepare request data
     request_data = {"url": url}
     
     # Call the Crawler API
     try:
-        result = await call_crawler_api("/links", request_data)
-        return json.dumps(result, indent=2)
+        # Pass the API's JSON through as-is rather than re-serializing it
+        return await cached_call_crawler_api("/links", request_data)
     except Exception as e:
-        return json.dumps({"error": f"Error extracting links: {str(e)}"})
+        return _dumps({"error": f"Error extracting links: {str(e)}"})
+
+
+def create_app():
+    """Build the ASGI app serving each enabled MCP transport."""
+    mcp.settings.stateless_http = int(MCP_WORKERS) > 1
+    
+    # Serve the routes of each enabled transport from one Starlette app
+    routes = []
+    if MCP_TRANSPORT in ("streamable-http", "all"):
+        routes.extend(mcp.streamable_http_app().routes)
+    if MCP_TRANSPORT in ("sse", "all"):
+        routes.extend(mcp.sse_app().routes)
+    
+    return Starlette(routes=routes, lifespan=lifespan)
 
 
 def main():
-    """Run the MCP server with SSE transport."""
-    import uvicorn
-    from starlette.applications import Starlette
-    from starlette.routing import Mount
+    """Run the MCP server over HTTP."""
+    port_env = os.getenv("PORT", "8080")
+    try:
+        port = int(port_env)
+    except ValueError:
+        raise SystemExit(f"Invalid PORT {port_env!r}: expected an integer")
+    if not 0 < port < 65536:
+        raise SystemExit(f"Invalid PORT {port}: expected 1-65535")
+    
+    if MCP_TRANSPORT not in MCP_TRANSPORTS:
+        raise SystemExit(
+            f"Invalid MCP_TRANSPORT {MCP_TRANSPORT!r}: "
+            f"expected one of {', '.join(MCP_TRANSPORTS)}"
+        )
+    
+    try:
+        workers = int(MCP_WORKERS)
+    except ValueError:
+        raise SystemExit(f"Invalid MCP_WORKERS {MCP_WORKERS!r}: expected an integer")
+    if workers < 1:
+        raise SystemExit(f"Invalid MCP_WORKERS {workers}: expected at least 1")
+    if workers > 1 and MCP_TRANSPORT != "streamable-http":
+        raise SystemExit(
+            "MCP_WORKERS > 1 requires MCP_TRANSPORT=streamable-http: "
+            "SSE sessions can't be shared between workers"
+        )
     
-    port = int(os.getenv("PORT", "8080"))
-    print(f"Starting MCP server on port {port}")
+    limit_concurrency = None
+    if MCP_LIMIT_CONCURRENCY:
+        try:
+            limit_concurrency = int(MCP_LIMIT_CONCURRENCY)
+        except ValueError:
+            raise SystemExit(
+                f"Invalid MCP_LIMIT_CONCURRENCY {MCP_LIMIT_CONCURRENCY!r}: expected an integer"
+            )
+        if limit_concurrency < 1:
+            raise SystemExit(
+                f"Invalid MCP_LIMIT_CONCURRENCY {limit_concurrency}: expected at least 1"
+            )
+    
+    print(f"Starting MCP server on port {port} ({MCP_TRANSPORT}, {workers} worker(s))")
     print(f"Crawler API URL: {CRAWLER_API_URL}")
     
-    # Create Starlette app with MCP SSE server mounted
-    app = Starlette(
-        routes=[
-            Mount("/", app=mcp.sse_app()),
-        ]
+    # Run with uvicorn on the uvloop event loop and httptools parser. Workers
+    # import the app themselves, so it is passed as a factory import string.
+    uvicorn.run(
+        "server_http:create_app",
+        factory=True,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=75,
+        backlog=2048,
+        workers=workers,
+        limit_concurrency=limit_concurrency
     )
-    
-    # Run with uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=port)
 
 
 if __name__ == "__main__":
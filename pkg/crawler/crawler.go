@@ -30,6 +30,9 @@ type Config struct {
 	URLFilter     string
 	SeedOnly      bool
 	ExtractLinks  bool
+	// Transport is shared across crawls when set, so idle connections are
+	// reused; a new one is created for each crawler otherwise.
+	Transport http.RoundTripper
 }
 
 type Statistics struct {
@@ -56,13 +59,14 @@ type Crawler struct {
 func New(config Config, frontier *frontier.URLFrontier, storage storage.Storage) *Crawler {
 	ctx, cancel := context.WithCancel(context.Background())
 
+	transport := config.Transport
+	if transport == nil {
+		transport = NewTransport()
+	}
+
 	httpClient := &http.Client{
-		Timeout: config.Timeout,
-		Transport: &http.Transport{
-			MaxIdleConns:        100,
-			MaxIdleConnsPerHost: 10,
-			IdleConnTimeout:     30 * time.Second,
-		},
+		Timeout:   config.Timeout,
+		Transport: transport,
 	}
 
 	return &Crawler{
@@ -80,6 +84,15 @@ func New(config Config, frontier *frontier.URLFrontier, storage storage.Storage)
 	}
 }
 
+// NewTransport returns the HTTP transport used for fetching pages.
+func NewTransport() *http.Transport {
+	return &http.Transport{
+		MaxIdleConns:        100,
+		MaxIdleConnsPerHost: 10,
+		IdleConnTimeout:     30 * time.Second,
+	}
+}
+
 func (c *Crawler) Start() error {
 	if c.config.Verbose {
 		fmt.Println("Starting crawler with", c.config.WorkerCount, "workers")
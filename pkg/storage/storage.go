@@ -24,15 +24,27 @@ type Storage interface {
 	Close() error
 }
 
+// StdoutName is the output file name that selects standard output instead of
+// a file on disk.
+const StdoutName = "-"
+
+func openOutput(filename string) (*os.File, error) {
+	if filename == StdoutName {
+		return os.Stdout, nil
+	}
+	return os.Create(filename)
+}
+
 type JSONStorage struct {
 	file      *os.File
 	encoder   *json.Encoder
 	mutex     sync.Mutex
 	dataItems []PageData
+	stream    bool
 }
 
 func NewJSONStorage(filename string) (*JSONStorage, error) {
-	file, err := os.Create(filename)
+	file, err := openOutput(filename)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create JSON file: %w", err)
 	}
@@ -41,6 +53,7 @@ func NewJSONStorage(filename string) (*JSONStorage, error) {
 		file:      file,
 		encoder:   json.NewEncoder(file),
 		dataItems: make([]PageData, 0),
+		stream:    filename == StdoutName,
 	}, nil
 }
 
@@ -55,12 +68,14 @@ func (j *JSONStorage) Close() error {
 	j.mutex.Lock()
 	defer j.mutex.Unlock()
 
-	if _, err := j.file.Seek(0, 0); err != nil {
-		return fmt.Errorf("failed to reset file position: %w", err)
-	}
+	if !j.stream {
+		if _, err := j.file.Seek(0, 0); err != nil {
+			return fmt.Errorf("failed to reset file position: %w", err)
+		}
 
-	if err := j.file.Truncate(0); err != nil {
-		return fmt.Errorf("failed to truncate file: %w", err)
+		if err := j.file.Truncate(0); err != nil {
+			return fmt.Errorf("failed to truncate file: %w", err)
+		}
 	}
 
 	if err := json.NewEncoder(j.file).Encode(j.dataItems); err != nil {
@@ -70,6 +85,37 @@ func (j *JSONStorage) Close() error {
 	return j.file.Close()
 }
 
+// MemoryStorage keeps crawled pages in memory for callers that consume them
+// directly instead of reading an output file.
+type MemoryStorage struct {
+	mutex     sync.Mutex
+	dataItems []PageData
+}
+
+func NewMemoryStorage() *MemoryStorage {
+	return &MemoryStorage{
+		dataItems: make([]PageData, 0),
+	}
+}
+
+func (m *MemoryStorage) Save(data PageData) error {
+	m.mutex.Lock()
+	defer m.mutex.Unlock()
+	m.dataItems = append(m.dataItems, data)
+	return nil
+}
+
+func (m *MemoryStorage) Close() error {
+	return nil
+}
+
+// Pages returns the pages saved so far.
+func (m *MemoryStorage) Pages() []PageData {
+	m.mutex.Lock()
+	defer m.mutex.Unlock()
+	return m.dataItems
+}
+
 type CSVStorage struct {
 	file    *os.File
 	writer  *csv.Writer
@@ -78,7 +124,7 @@ type CSVStorage struct {
 }
 
 func NewCSVStorage(filename string) (*CSVStorage, error) {
-	file, err := os.Create(filename)
+	file, err := openOutput(filename)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create CSV file: %w", err)
 	}
@@ -0,0 +1,210 @@
+package main
+
+import (
+	"bufio"
+	"bytes"
+	"encoding/json"
+	"errors"
+	"flag"
+	"fmt"
+	"io"
+	"net/http"
+	"sync"
+
+	"github.com/user/gocrawler/pkg/crawler"
+	"github.com/user/gocrawler/pkg/frontier"
+	"github.com/user/gocrawler/pkg/storage"
+)
+
+// maxRequestSize bounds a single request line read in server mode.
+const maxRequestSize = 1 << 20
+
+// errRequestTooLarge reports a request line longer than maxRequestSize.
+var errRequestTooLarge = fmt.Errorf("request larger than %d bytes", maxRequestSize)
+
+// maxBatchConcurrency bounds how many crawls of a batch run at once.
+const maxBatchConcurrency = 16
+
+type serverRequest struct {
+	Args []string `json:"args"`
+	// Stream asks for each page to be written on its own line as soon as it
+	// is crawled, ahead of the final response.
+	Stream bool `json:"stream"`
+	// Batch runs several independent crawls concurrently instead of Args.
+	// Each result is written on its own line as it finishes, ahead of the
+	// final response.
+	Batch [][]string `json:"batch"`
+}
+
+type serverResponse struct {
+	Pages []storage.PageData `json:"pages"`
+	Error string             `json:"error,omitempty"`
+}
+
+type batchResult struct {
+	Index int                `json:"index"`
+	Pages []storage.PageData `json:"pages"`
+	Error string             `json:"error,omitempty"`
+}
+
+type streamedPage struct {
+	Page storage.PageData `json:"page"`
+}
+
+// streamStorage writes every saved page straight to the server output.
+type streamStorage struct {
+	mutex   sync.Mutex
+	encoder *json.Encoder
+}
+
+func (s *streamStorage) Save(data storage.PageData) error {
+	s.mutex.Lock()
+	defer s.mutex.Unlock()
+	return s.encoder.Encode(streamedPage{Page: data})
+}
+
+func (s *streamStorage) Close() error {
+	return nil
+}
+
+// runServer reads one JSON request per line from in, runs the crawl it
+// describes and writes one JSON response per line to out. All crawls share
+// a single HTTP transport so connections are reused between requests.
+//
+// Streaming requests get one {"page": ...} line per crawled page, and batch
+// requests one {"index": ...} line per crawl, followed by a final response
+// with no pages.
+func runServer(in io.Reader, out io.Writer) error {
+	transport := crawler.NewTransport()
+	defer transport.CloseIdleConnections()
+
+	reader := bufio.NewReaderSize(in, 64*1024)
+	encoder := json.NewEncoder(out)
+
+	for {
+		line, err := readRequest(reader)
+		if err == io.EOF {
+			return nil
+		}
+
+		resp := serverResponse{Pages: make([]storage.PageData, 0)}
+
+		var req serverRequest
+		if errors.Is(err, errRequestTooLarge) {
+			resp.Error = fmt.Sprintf("invalid request: %v", err)
+		} else if err != nil {
+			return fmt.Errorf("failed to read request: %w", err)
+		} else if err := json.Unmarshal(line, &req); err != nil {
+			resp.Error = fmt.Sprintf("invalid request: %v", err)
+		} else if req.Batch != nil {
+			runBatch(req.Batch, transport, encoder)
+		} else if req.Stream {
+			store := &streamStorage{encoder: encoder}
+			if err := crawlOnce(req.Args, transport, store); err != nil {
+				resp.Error = err.Error()
+			}
+		} else {
+			store := storage.NewMemoryStorage()
+			if err := crawlOnce(req.Args, transport, store); err != nil {
+				resp.Error = err.Error()
+			} else {
+				resp.Pages = store.Pages()
+			}
+		}
+
+		if err := encoder.Encode(resp); err != nil {
+			return fmt.Errorf("failed to write response: %w", err)
+		}
+	}
+}
+
+// readRequest reads the next request line from r. A line longer than
+// maxRequestSize is read through to its end and reported as
+// errRequestTooLarge, so the next request can still be served.
+func readRequest(r *bufio.Reader) ([]byte, error) {
+	var line []byte
+	tooLarge := false
+
+	for {
+		chunk, err := r.ReadSlice('\n')
+		if !tooLarge {
+			if len(line)+len(chunk) > maxRequestSize+1 {
+				tooLarge = true
+				line = nil
+			} else {
+				line = append(line, chunk...)
+			}
+		}
+
+		if err == bufio.ErrBufferFull {
+			continue
+		}
+		if err == io.EOF && (len(line) > 0 || tooLarge) {
+			// Serve a final request that has no trailing newline.
+			break
+		}
+		if err != nil {
+			return nil, err
+		}
+		break
+	}
+
+	if tooLarge {
+		return nil, errRequestTooLarge
+	}
+	return bytes.TrimRight(line, "\r\n"), nil
+}
+
+// runBatch runs every crawl in batch concurrently, writing each result to
+// encoder as soon as it finishes.
+func runBatch(batch [][]string, transport http.RoundTripper, encoder *json.Encoder) {
+	var wg sync.WaitGroup
+	var mutex sync.Mutex
+	slots := make(chan struct{}, maxBatchConcurrency)
+
+	for i, args := range batch {
+		wg.Add(1)
+		go func(index int, args []string) {
+			defer wg.Done()
+			slots <- struct{}{}
+			defer func() { <-slots }()
+
+			result := batchResult{Index: index, Pages: make([]storage.PageData, 0)}
+			store := storage.NewMemoryStorage()
+			if err := crawlOnce(args, transport, store); err != nil {
+				result.Error = err.Error()
+			} else {
+				result.Pages = store.Pages()
+			}
+
+			mutex.Lock()
+			defer mutex.Unlock()
+			encoder.Encode(result)
+		}(i, args)
+	}
+
+	wg.Wait()
+}
+
+// crawlOnce runs a single crawl configured by command-line style args,
+// saving pages to store.
+func crawlOnce(args []string, transport http.RoundTripper, store storage.Storage) error {
+	fs, opts := newFlagSet("gocrawler", flag.ContinueOnError)
+	fs.SetOutput(io.Discard)
+	if err := fs.Parse(args); err != nil {
+		return err
+	}
+
+	if opts.seedURL == "" {
+		return errors.New("seed URL is required")
+	}
+
+	urlFrontier := frontier.NewURLFrontier()
+	urlFrontier.Add(opts.seedURL, 0)
+
+	config := opts.crawlerConfig()
+	config.Transport = transport
+
+	c := crawler.New(config, urlFrontier, store)
+	return c.Start()
+}